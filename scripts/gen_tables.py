@@ -0,0 +1,143 @@
+"""
+Generate src/_tables.py
+
+Builds the code point bitmaps used by `uni_text` for the running
+interpreter's Unicode version and writes them to ``src/_tables.py``, keeping
+the tables already shipped for other versions. Run it once with every
+supported Python version before a release:
+
+    python scripts/gen_tables.py
+
+For a Unicode version newer than any installed interpreter, build the
+tables from the matching ``unicodedata2`` release instead:
+
+    pip install unicodedata2==16.0.0
+    python scripts/gen_tables.py --unicodedata2
+"""
+
+import argparse
+import sys
+import unicodedata
+import zlib
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src import _tables, uni_text  # noqa: E402
+
+TABLES_PATH = ROOT / "src" / "_tables.py"
+
+# Width of the hex string literals in the generated file
+HEX_LINE_WIDTH = 96
+
+HEADER = '''"""
+Precomputed Unicode Tables
+
+Generated by scripts/gen_tables.py, do not edit by hand. Holds the
+zlib-compressed code point bitmaps of `uni_text` as hex strings, keyed by
+``unicodedata.unidata_version``, so importing the module does not have to scan
+every code point.
+"""
+'''
+
+
+def interpreter_predicates() -> dict:
+    """
+    Return the predicates `uni_text` builds its bitmaps from at import time.
+
+    Returns:
+        dict: Mapping of bitmap name to predicate.
+    """
+    return {
+        "punct": uni_text._is_punctuation_category,
+        "alpha": str.isalpha,
+        "digit": str.isdigit,
+    }
+
+
+def unicodedata2_predicates(ucd) -> dict:
+    """
+    Return predicates equivalent to `interpreter_predicates()` on the Unicode version of ucd.
+
+    CPython derives ``str.isalpha()`` from the letter categories and
+    ``str.isdigit()`` from the digit property of its Unicode database, so both
+    can be evaluated against another release of the database.
+
+    Args:
+        ucd: The ``unicodedata2`` module.
+
+    Returns:
+        dict: Mapping of bitmap name to predicate.
+    """
+    return {
+        "punct": lambda char: ucd.category(char)[0] == "P",
+        "alpha": lambda char: ucd.category(char) in ("Lu", "Ll", "Lt", "Lm", "Lo"),
+        "digit": lambda char: ucd.digit(char, None) is not None,
+    }
+
+
+def build_bitmaps(predicates: dict) -> dict:
+    """
+    Build the compressed bitmaps for a set of predicates.
+
+    Args:
+        predicates: Mapping of bitmap name to predicate, as returned by `interpreter_predicates()`.
+
+    Returns:
+        dict: Mapping of bitmap name to hex-encoded zlib data.
+    """
+    return {
+        name: zlib.compress(uni_text._build_char_bitmap(predicate), 9).hex() for name, predicate in predicates.items()
+    }
+
+
+def render(bitmaps_by_version: dict) -> str:
+    """
+    Render the source of src/_tables.py.
+
+    Args:
+        bitmaps_by_version: Mapping of Unicode version to the mapping returned by `build_bitmaps()`.
+
+    Returns:
+        str: Module source.
+    """
+    lines = [HEADER, "# Compressed bitmaps indexed by code point, per Unicode version and table name", "BITMAPS = {"]
+    for version in sorted(bitmaps_by_version, key=lambda v: tuple(map(int, v.split(".")))):
+        lines.append(f'    "{version}": {{')
+        for name, data in bitmaps_by_version[version].items():
+            lines.append(f'        "{name}": (')
+            for start in range(0, len(data), HEX_LINE_WIDTH):
+                lines.append(f'            "{data[start : start + HEX_LINE_WIDTH]}"')
+            lines.append("        ),")
+        lines.append("    },")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate src/_tables.py")
+    parser.add_argument(
+        "--unicodedata2",
+        action="store_true",
+        help="build the tables from the installed unicodedata2 package instead of the running interpreter",
+    )
+    args = parser.parse_args()
+
+    if args.unicodedata2:
+        import unicodedata2
+
+        version = unicodedata2.unidata_version
+        predicates = unicodedata2_predicates(unicodedata2)
+    else:
+        version = unicodedata.unidata_version
+        predicates = interpreter_predicates()
+
+    bitmaps_by_version = dict(_tables.BITMAPS)
+    bitmaps_by_version[version] = build_bitmaps(predicates)
+    TABLES_PATH.write_text(render(bitmaps_by_version), encoding="utf-8")
+    print(f"Wrote Unicode {version} tables to {TABLES_PATH}")
+
+
+if __name__ == "__main__":
+    main()
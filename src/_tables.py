@@ -0,0 +1,309 @@
+"""
+Precomputed Unicode Tables
+
+Generated by scripts/gen_tables.py, do not edit by hand. Holds the
+zlib-compressed code point bitmaps of `uni_text` as hex strings, keyed by
+``unicodedata.unidata_version``, so importing the module does not have to scan
+every code point.
+"""
+
+# Compressed bitmaps indexed by code point, per Unicode version and table name
+BITMAPS = {
+    "13.0.0": {
+        "punct": (
+            "78daedd9bd6ed3400000e033a9da484093ad9d68d818183a210644b3f2167d84be412c26061e844760ccc8233020d491"
+            "0922313412518fc4f9735c377f38948aef9372767ce7fbf39de5d38510c2f7abf03e09e1e3f0f4d9f017ded6bbefc26e"
+            "b4d3edef1d64e1fe389f37d9e1388417e1d32cc5ab7cf26616c6b36559a6b5f131764679aeaac069488a975a85e615a2"
+            "930d9b984e6abdae66fed64765297af168a167e6153ed92fe9dda27a950f3f96744752e9e89a0e8a8997d393f392c417"
+            "07599d0ed6cbfaf4f6a86ef142a77ccc0d4adada9b1cfbc5bc62b55dbfeca9c438fcfd88bf3a59479d579c7d633667ef"
+            "5eee65306a66376e9e453fce467163f9b0a8c4d755b3258e7446c1de56051cc69fc35e485ab794520f000000b07bdd95"
+            "292ef37feaedc5c8c186c5f58a251fe5ced37ccaebb31b75ebddac7b6d797156d700006cfc1d1c6be35da0abf8f0f1cd"
+            "d8dcdefe87b32d0a3ea8be2d93efe864eb3b77235d16b146c9d9be60215d67b65cc85d7cb2f3d1d22a5d282d5d8ca48b"
+            "83e3733171230be7db9d974fc3b75cf4e2dd0fb6a8733f3ccfff6daf487e1d17376f0f474fe0e4d6e417e10f57626519"
+            "e4765cd3cefcfccb3673e67516d6aa1ed3c95dcea8cd9d78d30300f77c9536fd104f1bcdbf568974edcfcf3d4f0c00e0"
+            "5f90ea02b8a793b7a10ffe97d53d00000000000000000000000000000000000000000000000000000000000000000000"
+            "000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000"
+            "0000000000000000000000000000000000000000000000000000000000000000000000000030f61bec1f666c"
+        ),
+        "alpha": (
+            "78daeddbbd6fdc540000f0e75c8a11b4ba0e0c1d2aae5207c6b2c140eb480cacfc050421061654462450ef06a4aeb074"
+            "422a330b6c0c5025122046361840dc750281a0110c1794bb3c6c3ffb3ed2a46d4229a1fc7e52eefcece7e7f7659ffd9e"
+            "1342b21b635efdd581d573ab31f663fa3b9acf6327f45e0c7b0c3f5bfb36c69d59ac8ddbf6eb4cf64b6db7cacb4abd98"
+            "b56995cb57f37629e57c7377619f0be1e5cdf07e08d372b9dc369a6f29c24a08d571f2a7cb7216aba7b33a8dac297db9"
+            "3cac77a96ca55dce87909525da8d37afff19e3f4cbf3612d7cdc099dd3a3ab55f8f54e19f5a510ce86d14659bae9af55"
+            "fc50ae5c19d5f1ab70157f25fcf4d5c56fce7c552615524146c3327fd32afd905789dcacc3b7aaf05a273c12b6aa708c"
+            "4f85b53706e5f6c928f6cb9cef5ce8cfdbad742ab4e16fc6317e144f9d5b2fb35e85dbeaaaabb0572ef4965ba4a9bb41"
+            "08c573af6cde8c9db5b46ee35cbd657ccf0d7eb17f317db781b6ef5c6c63e4e978cd31534b14bbf13eba5ef7947c16ce"
+            "77b338ec94c76bfe865973ec6e9993c1e9a53a48b2ebd5e789794fa93ade2c56d14b71bb55476dd7f69bfde7153b58a8"
+            "df5173bc513785b7ab836cd6bdaf4c3d1dbbde34aad715652facfc5847fee1f2ea4145dd27ef07288ae6f3c33afdda70"
+            "fdfbded7ddd8fb7e4f6f5829b31e97d6bd33b970e9c51bf18fd1f3297c26703fd5cdd15ff85cd07bf3e4e2b918e320f5"
+            "b77e63df0e77482fd79f97cecccfc3fe68e19c1c8f66d7df7673ca739bfbfb527ee0509c3f00001c41eff8e568e9ceb6"
+            "b897128493ed7374182cee53a487e3b834a4f867fa9ae46974e6d3711a986ac78526b3f1a1cae4b56a4511d2205075b4"
+            "ad7628ab7ce61ec6f0763b2639eed6cfe65fa4745eb974228467637e365cb972a57c5e6fc6d23acb59cfddbf033c50dd"
+            "ea4abdbd74a107f87bf313cb77abf50c613f6c7f10a7fdf5ef6edbb47da894e73969ee6653eef65cbf86fbde4db773fb"
+            "9bf3f5fdc96472b64ee1563df1f44999f7629ff2e647a8afe699229bd55f35093aeda462b4b5d48d07d66f53d6eeec23"
+            "2eccda1ead7daa39daf2d8fbec5fd4d3eb1befb577f97136df5ba5fd4c68f2dcd973bccd369c855bbbed934653f65e3b"
+            "dfde9bc52f9a74f2b090d472feb3c570bef4dd3d6c7fed7496da6310da1cced7f69ab9ebed85de1466bdb2d9334be1aa"
+            "42dead537ea1d99e8727437822c5da59ca60ff46dc68e6b0eb7a9cbfff908d3a07b65f2f0cf250bddf10daec7c7cc7f9"
+            "d27ab11b16e29f5e7e9f61f12d91fcaef5d5ddbf4f550f8ffddf2f574b8395c5ed93d4608f55ed5f5748be5a2e6d35a7"
+            "f6b98534b2bbb6d7349527459cc4bd33aafd9d94cc5ab9bc31add3cfeebd2f1c54f4ecdf9c7fed1ce57aeb46ed18fcbe"
+            "fd53fada41ffd38580ffe4f527bbfd12b4f8d4966e56cb5bc5d1df7f63eecee538b07c7936bbc36fb73d6efe81ffb763"
+            "dcff9b3185cc351af8d7ee7f9afb9a3c6c1dfe6a69d8e630f59fc75eccee3c3e060f67ff9fcd5d0d5ffd21fe72ab096c"
+            "fc38ac36bcb53e991e6a1a6e9afe77719cd21dceff9d75da6c7465baf7f6e90d8a7a02e2b0fb75ff4bfd6fffd710673f"
+            "648f1ecffc57e7c9b5ddf163effc7cedc36be3f14b7127767fdbf1bbcb031dff020000000078900ae39b24bd3bf58342"
+            "fdf030e9b8eac1b1e7d5de8762febb30ff0f7791bbd60000000000000000000000000000000000000000000000000000"
+            "000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000"
+            "00000000000000000000000000000000000000000000000000000000000000000000000070777f0166389c89"
+        ),
+        "digit": (
+            "78daeddb490e82300000c02a265c4c7c824ff569f2149fa077b52e315111941a64893307922e94b6f4d00542b8885978"
+            "329f86112ab7a22ae6734abd220e395c6ed13ddca4ad69b9bf74cc06385e9ab5b7dcf7e7fbf2ea32ebca7b8caf1aa971"
+            "009db3ebb51671b25d9e2ff788d966ddee138a553ce401000000189fdfec597cda1dbaa4bcdfd3e9abe60000981dabf1"
+            "6f2d06d0238f47a7e9f679c519f7edb9af29a95f15a4e74d1d05cff9df85da28b1fb77dcc9171a0000b43683336b0300"
+            "00e84511af74441b6bdb7f58f3fee7fa3dfa5dd298020000000000000000000000000000000000000000000000000000"
+            "000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000"
+            "000000000000000000000000000000000000000000000000000000000000000000000000000000000000000068e00425"
+            "6a5ae1"
+        ),
+    },
+    "14.0.0": {
+        "punct": (
+            "78daeddabd6ed3401c00f033a9da4840d3ad4c346c0c0c9d1003a259798b3e42df201613030fc22330e6311810eac804"
+            "91181a89a847e27c398ef389d382f8fda4d88eef7c77fefb2ef2e9124208df6fc28724844f83c3e7834f7857efbc0ffb"
+            "d14a77bfb69f6d0f47e5bccd764f427819be4d73bcce673fc9b6f1625591696db48fed6199eb1a701e92e2a966e1f60a"
+            "c9c996b7988e5bbda993fca58fca7274e3e95c64660d3e3b2c896e51bdca871f4bc29154dabb269d62ecd5e4e0b224f3"
+            "d551d6a6a3cd8a3e5f9ed4299e6897f7b97eb2d890ee78df2b9615ab0dfdaaa712e3e0f323fe6a6781baacb8f8c674cc"
+            "debfdc8fc1f0363b71fb227a71da8b1babbb4525beae1b2d71a83ddcf42f76a9e038fe1c4421692ea9a51e00000060ff"
+            "3a6b735ce7bfd45bf389fd2dabeb166b3ecd1da7f99cb7170b6deb2eb6bdb6ba3ab36b0000b67e0f8eb5d12ad04d7cf8"
+            "783135b7b6ff719705a2a3eaef65fc1e9dec7ce57ea4ab1236a8395b172ce46b4fa70bb9934ff7de5b9aa513a56c32d2"
+            "59322549e73bc7e762b646b69d2d775e3fcbfdef2284f9ab1fecd0e65e7891ffda5a93fd36ce2fde1e0f9fc0d9d2165c"
+            "853f9c89951570900b5f7b76fc659731f326dbd6aaeed3c97d8ea8ed9df9a5bf538742000095cfd2262fe269e3e4ce1a"
+            "916efcfa79e0890100fc0d5221807f74f036c4e07f99dd03000000000000000000000000000000000000000000000000"
+            "000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000"
+            "000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000023"
+            "bf010bf368ee"
+        ),
+        "alpha": (
+            "78daeddbbd8f1cd50100f037b7472622a0754161092b6b0929944e9714b1e7240a5afe026ca11434c8292325f26e8144"
+            "9b34ae2239354de82812742701a2a4234510bbae40a0702752eca1dbbd9779f366f6e37c77f6d9d8b998df4fbadd7933"
+            "6fdfbcaf997df3de5e08d9618c65fa6b029b9737631cc6fcf7703e8cbd30782d1c31fec7d63f633c58c4dabee773bdd9"
+            "71a91da6bc6c349b459756bdfd4ed96de59cef1cae7ce64ab8b113fe12c2bcdeae8f4d9647aab011423a4ff9cbba9cd5"
+            "e685a249a38865fd7aab4daf97cfb2973ff2520845bdeb30debdf37d8cf38f5f0a5be1bd5ee85d98bc93c26fa5d8af87"
+            "70294cb6ebd2cdff9de2877ae7c6a4899fc229fe46f8ea93ab9f5dfc24a59e0b3219d7f99ba7f4c3cb2991bb4d783785"
+            "6ff4c24fc25e0ac7f872d8fadda83e3e9bc4619df3832bc365bbd59e0f5df8b3698c7f8bcf5fbe5e673d85bbea6aaa70"
+            "506f0cd65ba4adbb5108d56fded8b91b7b5b79dff6e5e6c8f4811bfceaf06a7eef025ddfb9dac528f3f9da73e696a80e"
+            "e30fe84ed353ca45b83c2cea861ca5c66cfec6457bee7e9d93d185b53ac88a3be9f599654f491d6f11ab1ae4b8fd65ff"
+            "488773dc65c58e56ea77d29e6fd21ede4f27d9697a5f9d7a3e77bf89d8ecabea5e987cd944fee2e6e649453d26ef27a8"
+            "aaf6f5dd26fdc6f8fae7834ffb71f0f991deb051673daeed7b7b76e5da6b1fc4ff4c5ec9e18b811fd2692d37f8fd73ab"
+            "d7628ca3dcdf86ad633bdc19dd685eaf5d5c5e87c3c9ca35399d2ceebfdde19ce72ef78fb3fcc0a3deff0100e01c1bac"
+            "8d6cabfbc7afc7c2cfb5b18761b4fa992a3f1cc7b529c5efbbb9a16fd2745afcfb344f4c75f342b3c5fc50327b33eda8"
+            "429e044a67dbeba6b2ea67ee710c7fece624a7fde6d9fca39cce1bd79e09e1d7b1bc146eddba553fafb77369bdf5ac97"
+            "c6ef004f543fdda9f7d76ef4008fb63eb13e5a6d56088761ffaf713ebcfeaf7b0eed9f29e5654edad16ccedd91fbd7f8"
+            "d8d174b7b6bfb3dc3f9ccd66979a14769b55fef7ebbc57c794b77c88fa1ac46e50dca6971641e7bd5c8cae96faf1c4fa"
+            "6dcbda5fbcc4c5e8bc1e434fdf8f07f1e0c5b3b54f5aa3adcf5dc7df6ec2f345b9aa66797dfbcfdd283f2ed67b53dabf"
+            "0a6d9e7b47ceb7d3858bb07bd83d69b4651f74ebed8345fcaa4da70c2b49ade7bf580d976beffdb3f6d75e6fad3d4661"
+            "99c35efb3e68d7aef7577a5308bf68c3ed278bdc4b5385fca949f9d5f678197e1ec20b39d6c15a06871fc4ed760dbba9"
+            "c7e5ef1f8a49efc4eb6b10466548bf6f085d76de3bad7cb985fa6125fe85f5df33acfe4aa4ccd7e129e9f58fbfe6d3c3"
+            "e3f0bb9b696bb4b17a7c961becd9d4fe4d85949bf5d65e7b695fbeb7554f69af792e4f8e388b47575487073999add477"
+            "e74dfac583f785932edfe27fb9feda7b98fbad81dae3f8462bcec7fcc350abe88dba10f07f79ff29e2e29771dded68f5"
+            "a92d0f56eba1e2e4d17f31777a394e2c5fd98df9f617717e66fd811fb773dcffdb27f6c23d1a781c766f3ec89d28cf22"
+            "9561efec774bd33667197f9671108bd3e7c7e0e9ecff8bb5abf16fbf88dfecb681ed2fc7e9c01faecfe6675a869be7ff"
+            "5d9ce674c7cb7f679db707fb3f9afa1d3e72fb0c4655b300f1a09fa88e5f57396f86374ffe07e7c191fed9ffe939fd06"
+            "aff376fb70faecdb5fdf7ef7f674fa7a3c88fd6f0f7ceff244e7bf00000000009e28f39bb48a538e55aa87a749cf5d0f"
+            "ceff9792e5e7a761fdbbb2fe0ff751bad700000000000000000000000000000000000000000000000000000000000000"
+            "000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000"
+            "00000000000000000000000000000000000000000000000000000000000000707fff05e249da2d"
+        ),
+        "digit": (
+            "78daeddb4b0e82301400c0fa49d89878048fead1e4281e41f76a1563a2202035a260661626fd50fa9e5d60a92114e22c"
+            "942ca66184aa51d4d5bc6e6996c72197ab11ddcb5d624debfda6d36c80eba55bbcd5dc5faecbeac76c1aefb1be6ea5c6"
+            "012467ffd359c4c96e75f9b857ccb79bcfde215fc7631600000080f1e967cfe2d5ee50d1d2bea7f3ab990300e0e9d88c"
+            "fbb51c40461e5f9da63b6435efb86ff77d6e493d5590de37751594fbb7953e31e2f7bfe3af9cd00000e0cd27b894b3c8"
+            "000000f4288f571291fedbb6efabfe2903a38fdadf25ad29000000000000000000000000000000000000000000000000"
+            "000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000"
+            "00000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000800e"
+            "ced0215be3"
+        ),
+    },
+    "15.0.0": {
+        "punct": (
+            "78daeddabf6ed3401c00e033a9924840d3ad9d68d918183a210644baf2167d84be412c26061e844760cc633020d49109"
+            "22313412518fc44913c771fee21410df27c5767ce7bbf3cf77914f971042f87613de27217c1c1e3e1b7ec2db66f75dd8"
+            "8f8b74f76b07d9b63e2ee74db63b09e145f83acdf12a9ffd28dbc6f6aa22d3da781f3ba332d735e03c24c5536785db2b"
+            "24275bde623a69f5a68ef2973e2acbd18bc773919935f8b45e12dda266950f3f968423a9b477dd758a89977707972599"
+            "af1a599b1a9b157dbe3ca95b3cd129ef738364b121bdc9be5f2c2b561bfa554f25c6e1e77bfcd9c902755971f1ade998"
+            "fdf3723f06a3dbecc6ed8be8c7692f6eadee1695f8b26eb4c491ce683368ef52c161fc318c4272b6a4966600000080fd"
+            "ebaecd719dffd2bc984f1c6c595daf58f371ee38cde7bc6d2fb4adb7d8f6daeaeaccae0100d8fa3d38d6c6ab4037f1e1"
+            "e3c5d4dcdafe875d16881ad5dfcbe43d3ad9f9cafd4857256c5073b62e58c8d7994e1772279fecbdb79c954e94b2c948"
+            "77c994249def1c9f8ad95ad976b6dc79fd34f7bf8b10e6af7eb0439bfbe179feebc59aecb7717ef1f670f4044e97b6e0"
+            "2afce64cacac80835cf83ab3e3cf8dc2e8dcc4eb6c5babba4f4f07593fdeff88dadea95ffa7b55170200a87c9676f722"
+            "9eb68eeead11e9c653b6034f0c00e06f900a01fca383b72506ffcbec1e00000000000000000000000000000000000000"
+            "000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000"
+            "000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000"
+            "0000000018fb054fe26be7"
+        ),
+        "alpha": (
+            "78daeddb3d6f1cc70100d0591e9d0d1c1ba72285000b3e0106a252e99222d2124891d6bfc0128c146902a50c90807785"
+            "01b749a32a8052bb893b178e410249e0329d5dc4f09d2a1b3112124980a3c13b4e767676ef83226952b264427e0fe071"
+            "67676e76766676393bb30c213b8ab14c3f4d60f3fa668cc3987f1ecf5f622f0c5e0fc78cffbcf5718c878b543b8f7caf"
+            "373b29b7a354968d66b3e8f2aab7df2ebbad5cf2dda395efdc0c7777c31f4298d7db75dc641953858d10d271ca1fd6e7"
+            "596d5e299a3c8a58d69fdb6d7ebd7c94fdfc95d74228ea5d47f1e1832f639cffedb5b015deed85de95c9db29fccb94fa"
+            "8d10ae85c94e7d76f37fa5f4a1deb93169d2a7704abf113efff0d647573f4cb9e713998cebf2cd53fee146cae46113de"
+            "4be1bbbdf09db09fc231de085bbf1ad5f1b3491cd6253fbc395cb65bede5d0853f9ac6f8a7f8f2f53b75d153b8abaea6"
+            "0a07f5c660bd45daba1b8550fde4cddd87b1b795f7ed5c6f62a6e76ef05bc35bf97717e8facead2e45998fd71e33b744"
+            "7514bf460f9a9e522ec2e5515137e4283566f3332eda63f7eb928caeacd541563c489f2f2c7b4aea788b54d520a7ed2f"
+            "fb478ace6997153b5aa9df497bbc491b7d900eb2dbf4be3af77cec7e93b0d957d5bd30f9ac49fce9bdcdd34ef584b29f"
+            "a2aadacf779afc1be33b9f0cfede8f834f8ef5868dbae8716ddf5bb39bb75fff20fe77f2d31cbe1af83a9dd572835fbf"
+            "b47a2dc638cafd6dd83ab1c35dd0dde6f3f6d5e575389cac5c93d3c9e2fedb45e73277a57f9ae70f3ce9fd1f00002eb1"
+            "c1dac8b6faeaf4f558f8a536f5308c56bf53e587e3b836a5f8653737f4459a4e8bef4ff3c454372f345bcc0f25b35fa4"
+            "1d55c89340e968fbdd5456fdcc3d8ee1b7dd9ce4b4df3c9bff35e7f3e6ed1742f8712caf85edededfa79bd9d4bebad17"
+            "bd347e0778a6fae94e7db076a30778b2f589f5d16ab342380c077f8cf3e19d7f3c127570a19c97256947b3b974c7ee5f"
+            "e31347d3dddafeee72ff70369b5d6b72d86b56f9dfabcb5e9d70bee563d4d7207683e236bfb4083aefe5d3e86aa91f4f"
+            "addff65cfb8b8fb8189dd763e8e97bf1301ebe72b1f6496bb4f5b1ebf43b4d78be38afaa595edff97d37ca8f8bf5de94"
+            "f78f425be6deb1e3ed76e122ec1d754f1aedb90fbaf5f6c1227dd5e6538695acd6cb5fac86cbb5dffd8bf6d75e6fad3d"
+            "466159c25efb7bd0ae5d1facf4a6107ed086db6f16b997a60af95d93f3cfdaf832bc1ac2f773aac354c051f79ec1f083"
+            "b8d3ae6137f5b87cffa198f44ebdbe06615486f47e43e88af3ee59e7975ba81f56d25f597f9f61f52d91325f8767e4d7"
+            "3ff99a4f0f8fc3ffdc4b5ba38dd5f8596eb01753fb3715526ed65bfbeda57dfdd1563da3bde6f97c72c2593cbea23a3c"
+            "ccd96ca5be3b6ff22fcedf17caf0bfe600c77b50f14daebff61ee77e6ba0f634fea2159764fe21846d0d637cf50486aa"
+            "12f866ee3f455cbc19d7dd8e569fdaf260b51e2a4e9efc8db9b3cfe3d4f32bbb31dfc122cdf7ac3ff0ed7689fb7ffbc4"
+            "5eb847034fc3debdf3dc89cab059a7bd11f62f7eb7346d7391f1671907b1387b7e0c9ecffebf58bb1afffcd3f8c55e1b"
+            "d8f96c9c227e736736bfd032dc3cffefe234e73b5efe3bebbc8dec7f6bea773829cfd90ad529318351d52c409cf788d5"
+            "c9eb2a172ef9536ea3e1bdd3ffc17970ac7ff6bf7b49ff82d765bb7f347df1ad7fde7fe7fe74fa463c8cfd7f1ffabbcb"
+            "339dff020000000078a6cc6fd2ea9d1157a91e9eabceeeae07979e577b9f8bf5efcafa3f7c855215b0fa640e00000000"
+            "000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000"
+            "000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000"
+            "00000000000000000070b2ff03cfa9f70b"
+        ),
+        "digit": (
+            "78daeddbdb0ec1300000d0ba247b91f8049fead3ec537c02efa84b24986145a938e761492febdaae0feb6521ecc541b8"
+            "30ea871fd46c455bcce394dbea5872b8d9a253b84b5bd3723f69332870bc746b6fb3ef77f755ed65de2aef3cbe6da4c6"
+            "023a67f9d55ac4de62b2bb9c2286f3d97b9f504fe3ba0a000000c0efc9b366f16875689f727f4de75b350700c0d7b11a"
+            "e7352ea047ceb74ed3adaa963deee373af53524f15a4e74d1d0597f9ef85de51e2e7dff1ab2734cc350100727ec1a59c"
+            "4506000020a33a1ee888f4b96deebbca9c33ffe7fc3dfa5dd29802000000000000000000000000000000000000000000"
+            "000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000"
+            "000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000"
+            "00e8600b41a35de7"
+        ),
+    },
+    "15.1.0": {
+        "punct": (
+            "78daeddabf6ed3401c00e033a9924840d3ad9d68d918183a210644baf2167d84be412c26061e844760cc633020d49109"
+            "22313412518fc44913c771fee21410df27c5767ce7bbf3cf77914f971042f87613de27217c1c1e3e1b7ec2db66f75dd8"
+            "8f8b74f76b07d9b63e2ee74db63b09e145f83acdf12a9ffd28dbc6f6aa22d3da781f3ba332d735e03c24c5536785db2b"
+            "24275bde623a69f5a68ef2973e2acbd18bc773919935f8b45e12dda266950f3f968423a9b477dd758a89977707972599"
+            "af1a599b1a9b157dbe3ca95b3cd129ef738364b121bdc9be5f2c2b561bfa554f25c6e1e77bfcd9c902755971f1ade998"
+            "fdf3723f06a3dbecc6ed8be8c7692f6eadee1695f8b26eb4c491ce683368ef52c161fc318c4272b6a4966600000080fd"
+            "ebaecd719dffd2bc984f1c6c595daf58f371ee38cde7bc6d2fb4adb7d8f6daeaeaccae0100d8fa3d38d6c6ab4037f1e1"
+            "e3c5d4dcdafe875d16881ad5dfcbe43d3ad9f9cafd4857256c5073b62e58c8d7994e1772279fecbdb79c954e94b2c948"
+            "77c994249def1c9f8ad95ad976b6dc79fd34f7bf8b10e6af7eb0439bfbe179feebc59aecb7717ef1f670f4044e97b6e0"
+            "2afce64cacac80835cf83ab3e3cf8dc2e8dcc4eb6c5babba4f4f07593fdeff88dadea95ffa7b55170200a87c9676f722"
+            "9eb68eeead11e9c653b6034f0c00e06f900a01fca383b72506ffcbec1e00000000000000000000000000000000000000"
+            "000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000"
+            "000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000"
+            "0000000018fb054fe26be7"
+        ),
+        "alpha": (
+            "78daeddbbd6f64470100f0795e878742a2bd82e2244eec4991b8f2e8a0e0ee594a419bbf20778a2868d0512281bc5b44"
+            "4a0bcd5548479d86742942644b10a5a40b055176af0a22025b80b48ebcebe1cd9bf7f6c3673bf67d5ac9ef2779f7cdce"
+            "ecbc7933f39ee7cdbc0d213b8ab14c7f4d60f3fa668cc398ff1ecf9f632f0cde08c78cffb4f5b7180f17a9761ef95e6f"
+            "76526e47a92c1bcd66d1e5556fbf53765bb9e4bb472bdfb919eeee86df8730afb7ebb8c932a60a1b21a4fd943fac8fb3"
+            "dabc52347914b1ac5fb7dbfc7a792ffbf92baf8550d41f1dc5870fbe8c71fed16b612bbcd70bbd2b937752f81729f59b"
+            "215c0b939dfae8e6ff4ae943fde1c6a4499fc229fd46f8c7c7b73eb9fa71ca3d1fc8645c976f9ef20f3752260f9bf05e"
+            "0adfed856f85fd148ef146d8fae5a88e9f4de2b02ef9e1cde1b2dd6aaf862efcc934c63fc657afdfa98b9ec25d753555"
+            "38a83706eb2dd2d6dd2884ea276fed3e8cbdadfcd9cef526667aee06bf35bc95dfbb40d7776e7529cabcbf769fb925aa"
+            "a3f8143d687a4ab908974745dd90a3d498cddfb868f7ddaf4b32bab2560759f120bdbeb4ec29a9e32d5255839cb6bfec"
+            "1f293aa75d56ec68a57e27edfe266df441dac96ed3fbeadcf3befb4dc2e6b3aaee85c9e74de2cfee6d9e76a82794fd14"
+            "55d5bebedbe4df18dff974f0d77e1c7c7aac376cd4458f6b9fbd3dbb79fb8d0fe37f27afe7f0d5c0d37456cb0d7ef5ca"
+            "eab918e328f7b761ebc40e7741779bd7db5797e7e170b2724e4e278beb6f179dcbdc95fe591e3ff0a4d77f0000b8c406"
+            "6b23dbeaabd3d763e157dad4c3305afd4e956f8ee3da94e297dddcd017693a2d7e30cd1353ddbcd06c313f94cc7e9e3e"
+            "a8429e044a7bdbefa6b2ea7bee710cbfe9e624a7fde6defc2f399fb76ebf14c28f63792d6c6f6fd7f7ebed5c5a6fbde8"
+            "a5f13bc073d54f57ea83b50b3dc093ad4fac8f569b15c26138f8439c0feffcfd91a8830be5bc2c493b9acda53b76fd1a"
+            "9f389aeed6f677979f0f67b3d9b52687bd6695fffdbaecd509c75b3e467d0d6237286ef34b8ba0f35e3e8cae96faf1d4"
+            "fa6d8fb5bf78898bd1793d869ebe1f0fe3e1f72ed63e698db6de779d7ea709cf17c75535cbeb3bbfeb46f971b1de9bf2"
+            "fe5168cbdc3bb6bfdd2e5c84bda3ee4ea33df641b7de3e58a4afda7ccab092d57af98bd570b9f6debf687fedf5d6da63"
+            "149625ecb5ef8376edfa60a53785f08336dc7eb3c8bd3455c86f9b9c7fdac697e1fb217c37a73a4c051c75cf190c3f8c"
+            "3bed1a76538fcbe71f8a49efd4f36b10466548cf3784ae38ef9d757cb985fa6125fd95f5e719569f1229f37978467efd"
+            "93cff974f338fccfbdb435da588d9fe5067b39b57f5321e566bdb5df9edad71f6dd533da6b9e8f27279cc5e32baac3c3"
+            "9ccd56eabbf326ffe2fc7da10cff6b7670bc07152f72fdb5f738d75b03b567f11fadb824f30f216c6b18e3ab27305495"
+            "c08bb9fe1471f1645c77395abd6bcb83d57aa83879f227e6ce3e8e538fafecc67c078b34dfb1fec037db25eeffed1d7b"
+            "e11a0d3c0b7bf7ce73252ac3669df646d8bff8d5d2b4cd45c69f651cc4e2ecf931f87af6ffc5dad5f8679fc52ff6dac0"
+            "cee7e314f1eb3bb3f98596e1e6f9b78bd39cef78f973d6791bd9ffc6d4ef70529eb315aa536206a3aa598038ef1eab93"
+            "d7552e5cf267dc46c37ba7ffc07970ac7ff6bf7d49ff83d765bb7f347df9ed7fde7ff7fe74fa663c8cfd7f1ffabfcb73"
+            "9dff020000000078aecc6fd2ea9d1157a91ebe569ddd550f2ebda7fcebbbca6af60b59ffaeacffc357285501ab77e600"
+            "000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000"
+            "000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000"
+            "0000000000000000000000000027fb3fbff3440c"
+        ),
+        "digit": (
+            "78daeddbdb0ec1300000d0ba247b91f8049fead3ec537c02efa84b24986145a938e761492febdaae0feb6521ecc541b8"
+            "30ea871fd46c455bcce394dbea5872b8d9a253b84b5bd3723f69332870bc746b6fb3ef77f755ed65de2aef3cbe6da4c6"
+            "023a67f9d55ac4de62b2bb9c2286f3d97b9f504fe3ba0a000000c0efc9b366f16875689f727f4de75b350700c0d7b11a"
+            "e7352ea047ceb74ed3adaa963deee373af53524f15a4e74d1d0597f9ef85de51e2e7dff1ab2734cc350100727ec1a59c"
+            "4506000020a33a1ee888f4b96deebbca9c33ffe7fc3dfa5dd29802000000000000000000000000000000000000000000"
+            "000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000"
+            "000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000"
+            "00e8600b41a35de7"
+        ),
+    },
+    "16.0.0": {
+        "punct": (
+            "78daeddabd6ed3401c00f00ba99a484093ad4c346c0c0c9d10032259798b3e42df201613030fc2c8c898c76040282313"
+            "54626824a21e899b268ee3a44e70ca877e3f29b66b9fefe37f67cba76b08217cbb0cef6a217c9c1c3e9dfcc29be6e06d"
+            "d88f5eb2fbbde3747b789dcfeb74f72884e7e1eb3cc5cb6cf276ba8ddd4d5926f5eb7dec4ff3bcad02a7a1963fd5c935"
+            "2f77b9b665139359adcb6a676f7d5094e2221e2f456651e193c382e8e635abecfc58108e5aa5a3eb6650ccbcb839382b"
+            "487cde48ebd42897f5e9fa4b83fc897eb730d578d2d661be7b66fb513eaf586de837f54a8c93dff7f8b39f06eaace2ec"
+            "5bf367f6cfcbbc0ca6cd1cc4edb318c5f9286e6d1e1695f872dbd312a7fad3cdb8bb4b0147f1c7240ab5ce9a529a0100"
+            "0000f66f706b8a61f68f666ff9e278cbe22ef2251f678e936ccaabee4add2e56eb5edf5c9cd93500005b7f07c7faf52a"
+            "d065bcff70f56a666dfffd2e0b448deadb32fb8eaeed7ce77e249b2e9428395d17cca5ebcfa70b99938f77ae62af64ba"
+            "4ee144299d8c0cd64c4992e5c1f1299fac956e17cb9dc32799ffbb0861f9ee7b652af96179008cc2b36d9a7a1597176f"
+            "8fa63d70b2b606e7e137676245191c64c2d75f1c7f6ee49ece75b2957c956eeb558fe9798c47f1ee9fa8ed9d78d3dfa9"
+            "43210080ca6769371fe249ab5d45fec352df7ca5a76c077a0c00e06f900801fca30f6f4b0cfed377e540b80100000000"
+            "000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000"
+            "000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000"
+            "000000000000000000000000000000000000a0d82ff5d26f7a"
+        ),
+        "alpha": (
+            "78daeddbbd6f24570100f0375e874121d15e41711227f6a4485c7974507037965250d0e42fc89d220a1a74944820ef16"
+            "91d2427315d251a7215d0a886c89a09474a1208af7aa2022b00548ebc8bb7ecc9b37b31f3edb67dff92ed6ddef27793d"
+            "6fe6edfb9a37b36fdedb0d213b8cb14c7f4d60fdfa7a8cc398ff9ecc9f632f0cde0a47ecfc69e36f311ecc636d3df2be"
+            "def4b8d40e5359d69acda24babde7eafecb672c9b70f97de7333dcdd0ebf0b61566fd7c7c68b2355580b21e5537ebfae"
+            "67b57ea568d2286259bf6eb6e9f5722e7bf92d6f8450d4bb0ee3c3075fc538fbcb1b61237cd00bbd2be3f752f8e729f6"
+            "db215c0be3adba76b37fa5f8a1deb9366ee2a7708abf16fef1c9ad4faf7e9252cf1519efd4e59ba5f4c38d94c8c326bc"
+            "9bc2777be11b612f8563bc11367e31aa8f4fc7715897fce0e67071de6aaf872efce924c63fc4d7afdfa98b9ec25d7335"
+            "4d38a83706ab67a46dbb5108d58fded97e187b1b79dfd6f5e6c8e4cc27fcd6f056fedf05babe73ab8b51e6fcda3cf399"
+            "a80ee3057ad0f494721e2e0f8bfa448ed2c96cfe768a36ef7e5d92d1959536c88a07e9f595454f491d6f1eab1ae4b8fd"
+            "45ff488773dc45c38e96da77dce6376e0fefa74cb69bde57a79ef3ee37119b7d555bfa2f9ac89fdf5b3fa9aac794fd04"
+            "55d5bebedfa4dfd8b9f3d9e0affd38f8ec486f58ab8b1e57f6bd3bbd79fbad8fe27fc76fe6f0d5c0453aedcc0d7ef9da"
+            "f2b518e328f7b761ebd80e774e779bd7db5717d7e170bc744d4ec6f3fb6f773897b92bfdb3ac3ff0b4f77f0000b8c406"
+            "2b23dbeaf1f1ebb1f06b6dec61182dbfa7ca0fc771654af1abeee097833409f8c7499e98eae685a6f3f9a164fab3b4a3"
+            "0a791228e5b6d74d65d5cfdc3b31fcba9b939cf49b67f38f733aefdc7e25841fc6f25ad8dcdcac9fd7dbb9b4de6ad14b"
+            "e37780e7aa9feed4fb2b377a80a75b9f581dad362b84c3b0fffb381bdef9fb2387f6cf95f2a224ed683697eec8fd6be7"
+            "d8d174b7b6bfbdd83f9c4ea7d79a14769b55fe0febb257c7d4b77c82f61ac46e50dca697164167bd5c8dae95faf1c4f6"
+            "6debda9fbfc4f9e8bc1e434f3e8c07f1e03b8b3bf959a435da3aef3abfad263c9bd7ab6a96d7b77edb8df2e37cbd3795"
+            "e207a12d73ef487fd8eec245d83dec9e34daba0fbaf5f6c13c7ed5a65386a5a456eb5f2c87cb95ffcd494ecf21a32ea7"
+            "c7f4d75e2f5c5b3a1fa3b02861affd3f68d7aef7977a5308df6bc3ed3b8bdc4b5383fca649f9c7edf1327c37846fe758"
+            "07a980a3ee7b06c38fe2562cda464fcbdaf3ef3f14e39477fc49d3def5d6ab4bf51d84511946bd7938840f4eab5f3e43"
+            "fdb014ffcaeaf71996bf2552e6ebf094f4fac75ff3e9e171f89f7b696bb4b67c7c9a4f58aa41d13448b95e6fedb597f6"
+            "f547cfeaf1f9a6837196eb93234ee3d115d5e1418eb991faeeac49bf38fbb55886ff35191c1de6145fe7fa6bef49eeb7"
+            "066acfe213adb824f30f216c9a0b7919951795d0d0850dcfe2d3a27ac1eb77118a38ff665c773b5a7e6acb83d57aa838"
+            "7ed26fccadae8d9c5c8f13eb577663befd799c6ff9cce5e57689fb7f95172f0b9f41c0b3b07bef4c0f6961bd8e7b23ec"
+            "9dff6e69dae63ce3cf320e6271fafc18bc98fd7fbe76b5f3d3cfe397bb6d60eb8b9d74e05777a6b3732dc3cdf26f1727"
+            "39dd9dc5cf5967edc1fe4bd3bec37179c6b3509df4dc39aa9a058873cc183cfdddff71ef4ff93cdde07878efe41f380f"
+            "8ef4cffe372fe927785db6fb879357dffde7fdf7ef4f266fc783d8fff781cf5d9eebfc1700000000c073657e9356ef94"
+            "6395e6e185eaecee7a70e95df0afef2aabd95fcbfa7765fd1f1ea3d4042c3f9903000000000000000000000000000000"
+            "000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000"
+            "000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000001cef"
+            "ff8f3057d2"
+        ),
+        "digit": (
+            "78daeddbdd0ec1301800d0fa497623f1081ed5a3d9a37804ee512312ccd86aca24e75c48d6765dfbf9245d37219cc449"
+            "b8331b873f549f4553497bcd73651cf2717d46d7e32e734d6bfda6c36480f9d26dbef5d857e715cd7d3eebefb6bc2953"
+            "e30082b3fde928e268b3a83eae05d3f5eab3572897715f04000000e0ffe4d9b368db1d3ad5bcded3f9d5c80100b03a36"
+            "e2bce69923d2e919fea8cf357645c333eecb551f6b52df2a486f9b9a05f7edab88c579cf8caaf79837d3dbfaeffb8686"
+            "7b4d00c0dae1bbabb94fc4d0f7000000eebb4856c63381c899897df3b7edfc43e1b79879d6fe2e29a700000000000000"
+            "000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000"
+            "000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000"
+            "000000000000000000000000000000003a3802fe5c6603"
+        ),
+    },
+}
@@ -5,12 +5,452 @@ Provides utilities for text processing, including punctuation detection,
 punctuation removal, and CJK character detection.
 """
 
+import functools
 import logging
+import re
+import sys
 import unicodedata
+import zlib
+from collections.abc import Callable, Iterable
+
+from . import _tables
 
 logger = logging.getLogger(__name__)
 
 
+def _build_char_bitmap(predicate) -> bytes:
+    """
+    Build a bitmap of all code points whose character satisfies predicate (private helper).
+
+    The table covers the full code point range (~136 KiB) and is built once at
+    import, so later checks are a single byte lookup instead of a call into
+    ``unicodedata`` or a ``str`` method.
+
+    Args:
+        predicate: Callable taking a single character and returning a bool.
+
+    Returns:
+        bytes: Read-only bitmap indexed by code point.
+    """
+    bitmap = bytearray((sys.maxunicode + 8) // 8)
+    for char in filter(predicate, map(chr, range(sys.maxunicode + 1))):
+        cp = ord(char)
+        bitmap[cp >> 3] |= 1 << (cp & 7)
+    return bytes(bitmap)
+
+
+def _load_char_bitmap(name: str, predicate) -> bytes:
+    """
+    Load a bitmap shipped in `_tables` for the running Unicode version (private helper).
+
+    Building a bitmap scans every code point and takes a noticeable part of a
+    second, so release builds ship them precomputed. When the interpreter's
+    ``unicodedata.unidata_version`` has no shipped tables, the bitmap is built
+    with predicate instead, giving the same result more slowly.
+
+    Args:
+        name: Key of the bitmap in `_tables.BITMAPS`.
+        predicate: Callable taking a single character and returning a bool.
+
+    Returns:
+        bytes: Read-only bitmap indexed by code point.
+    """
+    shipped = _tables.BITMAPS.get(unicodedata.unidata_version)
+    if shipped is not None:
+        bitmap = zlib.decompress(bytes.fromhex(shipped[name]))
+        if len(bitmap) == (sys.maxunicode + 8) // 8:
+            return bitmap
+    logger.debug("No precomputed %r table for Unicode %s, building it", name, unicodedata.unidata_version)
+    return _build_char_bitmap(predicate)
+
+
+def _is_punctuation_category(char: str, _category=unicodedata.category) -> bool:
+    """Return True if the Unicode category of char starts with "P" (private helper)."""
+    # Bound as a default argument: this runs once per code point while the bitmap is built
+    return _category(char)[0] == "P"
+
+
+def _build_range_bitmap(ranges, start: int, end: int) -> bytes:
+    """
+    Build a bitmap marking the parts of ranges that fall in [start, end) (private helper).
+
+    Whole bytes inside a range are filled with a single slice assignment, so
+    only the few bits at each range edge are set one by one.
+
+    Args:
+        ranges: Inclusive (first, last) code point pairs.
+        start: First code point covered by the bitmap (must be a multiple of 8).
+        end: Code point just past the covered span.
+
+    Returns:
+        bytes: Read-only bitmap indexed by ``code_point - start``.
+    """
+    bitmap = bytearray((end - start + 7) // 8)
+    for first, last in ranges:
+        offset = max(first, start) - start
+        stop = min(last + 1, end) - start
+        # Leading bits up to the first byte boundary
+        while offset < stop and offset & 7:
+            bitmap[offset >> 3] |= 1 << (offset & 7)
+            offset += 1
+        # Whole bytes
+        full = (stop - offset) >> 3
+        if full > 0:
+            bitmap[offset >> 3 : (offset >> 3) + full] = b"\xff" * full
+            offset += full << 3
+        # Trailing bits
+        while offset < stop:
+            bitmap[offset >> 3] |= 1 << (offset & 7)
+            offset += 1
+    return bytes(bitmap)
+
+
+# Bitmap bytes with at least one bit set, and runs of full bytes or a single partially set byte
+_BITMAP_SET_BYTE_RE = re.compile(rb"[^\x00]")
+_BITMAP_RUN_RE = re.compile(rb"\xff+|[^\x00\xff]")
+
+
+def _iter_bitmap(bitmap: bytes):
+    """
+    Yield every code point whose bit is set in a bitmap (private helper).
+
+    Args:
+        bitmap: Bitmap indexed by code point.
+
+    Yields:
+        int: Code points in ascending order.
+    """
+    # Zero bytes, most of the bitmap, are skipped by the regex engine
+    for match in _BITMAP_SET_BYTE_RE.finditer(bitmap):
+        index = match.start()
+        byte = bitmap[index]
+        for bit in range(8):
+            if (byte >> bit) & 1:
+                yield (index << 3) | bit
+
+
+def _bitmap_char_class(bitmap: bytes) -> str:
+    """
+    Convert a bitmap into the body of a regular expression character class (private helper).
+
+    Consecutive code points are collapsed into ``a-b`` ranges to keep the
+    pattern short.
+
+    Args:
+        bitmap: Bitmap indexed by code point.
+
+    Returns:
+        str: Escaped character class body, without the surrounding brackets.
+    """
+    ranges = []
+    # Runs of full bytes (e.g. CJK ideographs) are taken whole, only partial bytes are split into bits
+    for match in _BITMAP_RUN_RE.finditer(bitmap):
+        start = match.start() << 3
+        if match.group()[0] == 0xFF:
+            runs = ((start, (match.end() << 3) - 1),)
+        else:
+            byte = match.group()[0]
+            runs = ((start | bit, start | bit) for bit in range(8) if (byte >> bit) & 1)
+        for first, last in runs:
+            if ranges and ranges[-1][1] == first - 1:
+                ranges[-1][1] = last
+            else:
+                ranges.append([first, last])
+    return "".join(
+        re.escape(chr(first)) if first == last else f"{re.escape(chr(first))}-{re.escape(chr(last))}"
+        for first, last in ranges
+    )
+
+
+def _compile_context_punct_drop_re(alpha_class: str, digit_class: str, marks: str = "'./") -> re.Pattern | None:
+    """
+    Compile a regex matching context-sensitive punctuation that fails its rule (private helper).
+
+    Each branch matches the mark unless a negative lookahead recognises the
+    preserved form, so all neighbours are read from the original text in a
+    single regex pass:
+    - Apostrophe kept after a letter and before a letter or the end ("don't", "John's", "workers'")
+    - Period kept between digits, after a digit at the end ("5."), or at the start before a digit (".5")
+    - Slash kept between digits ("2024/01/01", "1/2") or between letters ("km/h")
+
+    Args:
+        alpha_class: Character class body matching letters (str.isalpha()).
+        digit_class: Character class body matching digits (str.isdigit()).
+        marks: Context-sensitive marks to handle; only their branches are compiled.
+
+    Returns:
+        re.Pattern | None: Pattern whose matches should be deleted, or None if marks is empty.
+    """
+    a = f"[{alpha_class}]"
+    d = f"[{digit_class}]"
+    branches = {
+        "'": rf"'(?!(?<={a}')(?:{a}|\Z))",
+        ".": rf"\.(?!(?<={d}\.)(?:{d}|\Z)|(?<=\A\.){d})",
+        "/": rf"/(?!(?<={d}/){d}|(?<={a}/){a})",
+    }
+    pattern = "|".join(branch for mark, branch in branches.items() if mark in marks)
+    return re.compile(pattern) if pattern else None
+
+
+def _build_punct_delete_table(kept: str) -> dict:
+    """
+    Build a str.translate() table deleting every punctuation mark except kept (private helper).
+
+    Args:
+        kept: Punctuation marks left in place by the table.
+
+    Returns:
+        dict: Mapping of code point to None, as built by str.maketrans().
+    """
+    deleted = "".join(chr(cp) for cp in _iter_bitmap(_PUNCT_BITMAP) if chr(cp) not in kept)
+    return str.maketrans("", "", deleted)
+
+
+def _ascii_delete_bytes(delete_table: dict) -> bytes:
+    """
+    Extract the ASCII part of a deletion table for bytes.translate() (private helper).
+
+    For ASCII-only text, ``text.encode("ascii").translate(None, delete)`` is a
+    plain byte filter and avoids the per-call cache setup of str.translate(),
+    which dominates for short strings.
+
+    Args:
+        delete_table: Table built by `_build_punct_delete_table()`.
+
+    Returns:
+        bytes: ASCII code points to delete.
+    """
+    return bytes(cp for cp in delete_table if cp < 0x80)
+
+
+@functools.lru_cache(maxsize=None)
+def _build_punctuation_remover(
+    preserve_apostrophe: bool,
+    preserve_decimal: bool,
+    preserve_slash: bool,
+    preserve_percent: bool,
+    preserve_hyphen: bool,
+) -> Callable[[str], str]:
+    """
+    Build a punctuation remover specialised for a set of preservation rules (private helper).
+
+    Disabled rules are left out of the compiled regex and their marks are added
+    to the deletion table, so the returned function performs no flag checks.
+    Results are cached per flag combination.
+
+    Args:
+        preserve_apostrophe: Keep apostrophes in contractions and possessives.
+        preserve_decimal: Keep decimal points in numbers.
+        preserve_slash: Keep slashes in dates, fractions and units.
+        preserve_percent: Keep percent signs.
+        preserve_hyphen: Keep hyphens/dashes (-).
+
+    Returns:
+        Callable[[str], str]: Function removing punctuation from a text.
+    """
+    context = "".join(
+        mark
+        for mark, enabled in (("'", preserve_apostrophe), (".", preserve_decimal), ("/", preserve_slash))
+        if enabled
+    )
+    preserved = "".join(mark for mark, enabled in (("%", preserve_percent), ("-", preserve_hyphen)) if enabled)
+    delete_table = _build_punct_delete_table(context + preserved)
+    ascii_delete = _ascii_delete_bytes(delete_table)
+    drop_re = _compile_context_punct_drop_re(_ALPHA_CHAR_CLASS, _DIGIT_CHAR_CLASS, context)
+    ascii_drop_re = _compile_context_punct_drop_re(_ASCII_ALPHA_CHAR_CLASS, _ASCII_DIGIT_CHAR_CLASS, context)
+
+    if drop_re is None:
+
+        def remove(text: str) -> str:
+            if not text:
+                return text
+            if text.isascii():
+                if _ASCII_PUNCT_SEARCH_RE.search(text) is None:
+                    return text
+                return text.encode("ascii").translate(None, ascii_delete).decode("ascii")
+            if _PUNCT_SEARCH_RE.search(text) is None:
+                return text
+            return text.translate(delete_table)
+
+    else:
+
+        def remove(text: str) -> str:
+            if not text:
+                return text
+
+            # Text without any punctuation is returned as is, without building a copy. Otherwise
+            # drop context-sensitive punctuation that fails its rule, judged on the original text,
+            # then remove all remaining punctuation in a single pass
+            if text.isascii():
+                if _ASCII_PUNCT_SEARCH_RE.search(text) is None:
+                    return text
+                text = ascii_drop_re.sub("", text)
+                return text.encode("ascii").translate(None, ascii_delete).decode("ascii")
+            if _PUNCT_SEARCH_RE.search(text) is None:
+                return text
+            return drop_re.sub("", text).translate(delete_table)
+
+    return remove
+
+
+def _collapse_punctuation_run(match: re.Match) -> str:
+    """
+    Keep only the first punctuation mark of each run in a regex match (private helper).
+
+    Runs made only of BMP characters are pure punctuation. Runs containing
+    supplementary characters are re-checked against the punctuation set.
+
+    Args:
+        match: Match of `_CONSECUTIVE_PUNCT_RE` or one of its ASCII-only variants.
+
+    Returns:
+        str: Replacement text for the match.
+    """
+    run = match.group()
+    if max(run) < "\U00010000":
+        return run[0]
+
+    # Pre-sized buffer filled by index, trimmed once at the end
+    result = [""] * len(run)
+    j = 0
+    prev_is_punc = False
+    punct_chars = _PUNCT_CHARS
+    for char in run:
+        is_punc = char in punct_chars
+        if is_punc and prev_is_punc:
+            continue
+        result[j] = char
+        j += 1
+        prev_is_punc = is_punc
+    return "".join(result[:j])
+
+
+def _remove_consecutive_punctuations(text: str) -> str:
+    """Implementation of `UniText.remove_consecutive_punctuations()` (private helper)."""
+    if not text:
+        return text
+
+    # Collapse each punctuation run to its first mark in a single regex pass
+    consecutive_re = _ASCII_CONSECUTIVE_PUNCT_RE if text.isascii() else _CONSECUTIVE_PUNCT_RE
+    return consecutive_re.sub(_collapse_punctuation_run, text)
+
+
+def _memoized(impl: Callable[[str], str]) -> tuple[Callable[[str], str], Callable[[Iterable[str]], list[str]]]:
+    """
+    Wrap a text function with a memo for short texts (private helper).
+
+    Texts longer than `_MEMO_MAX_LENGTH` bypass the memo and are passed to
+    impl directly. The single-text callable exposes the memo's cache_clear().
+
+    Args:
+        impl: Function computing the result for one text.
+
+    Returns:
+        tuple: Callables for one text and for an iterable of texts, sharing one memo.
+    """
+    memo = functools.lru_cache(maxsize=_MEMO_MAXSIZE)(impl)
+    limit = _MEMO_MAX_LENGTH
+
+    def single(text: str) -> str:
+        if text and len(text) > limit:
+            return impl(text)
+        return memo(text)
+
+    def batch(texts: Iterable[str]) -> list[str]:
+        return [impl(text) if text and len(text) > limit else memo(text) for text in texts]
+
+    single.cache_clear = memo.cache_clear
+    return single, batch
+
+
+def _clean_punctuations(text: str) -> str:
+    """Implementation of `UniText.clean_punctuations()` (private helper)."""
+    if not text:
+        return text
+    return _KEPT_PUNCT_RUN_RE.sub(_collapse_punctuation_run, _remove_punctuations(text))
+
+
+# Punctuation bitmap indexed by code point, the source of all punctuation tables below
+_PUNCT_BITMAP = _load_char_bitmap("punct", _is_punctuation_category)
+
+# Every punctuation character, for single-character membership tests
+_PUNCT_CHARS = frozenset(map(chr, _iter_bitmap(_PUNCT_BITMAP)))
+
+# Punctuation kept or dropped depending on its neighbours (see `UniText.remove_punctuations()`)
+_CONTEXT_PUNCTUATIONS = "'./"
+
+# Punctuation that is always preserved by `UniText.remove_punctuations()`
+_PRESERVED_PUNCTUATIONS = "%-"
+
+# Character classes matching exactly str.isalpha() and str.isdigit(), over all code points and over ASCII
+_ALPHA_BITMAP = _load_char_bitmap("alpha", str.isalpha)
+_DIGIT_BITMAP = _load_char_bitmap("digit", str.isdigit)
+_ALPHA_CHAR_CLASS = _bitmap_char_class(_ALPHA_BITMAP)
+_DIGIT_CHAR_CLASS = _bitmap_char_class(_DIGIT_BITMAP)
+_ASCII_ALPHA_CHAR_CLASS = _bitmap_char_class(_ALPHA_BITMAP[:16])
+_ASCII_DIGIT_CHAR_CLASS = _bitmap_char_class(_DIGIT_BITMAP[:16])
+
+# Run of two or more punctuation marks left behind by a punctuation remover. A kept
+# context-sensitive mark always has non-punctuation neighbours, so only the always-preserved
+# marks can form runs. The leading class, unlike a {2,} repeat, lets re skip ahead to candidates
+_KEPT_PUNCT_CHAR_CLASS = re.escape(_PRESERVED_PUNCTUATIONS)
+_KEPT_PUNCT_RUN_RE = re.compile(f"[{_KEPT_PUNCT_CHAR_CLASS}][{_KEPT_PUNCT_CHAR_CLASS}]+")
+
+# Run of two or more punctuation candidates (see `_collapse_punctuation_run()`). The class
+# holds BMP punctuation plus every supplementary character: re compiles BMP-only sets into
+# a constant-time lookup but scans supplementary ranges one by one for every character
+_BMP_PUNCT_CHAR_CLASS = _bitmap_char_class(_PUNCT_BITMAP[: 0x10000 >> 3])
+_CONSECUTIVE_PUNCT_RE = re.compile(f"[{_BMP_PUNCT_CHAR_CLASS}\\U00010000-\\U0010FFFF]{{2,}}")
+
+# Same for ASCII-only text, where a 128-entry class replaces the BMP lookup
+_ASCII_PUNCT_CHAR_CLASS = _bitmap_char_class(_PUNCT_BITMAP[:16])
+_ASCII_CONSECUTIVE_PUNCT_RE = re.compile(f"[{_ASCII_PUNCT_CHAR_CLASS}]{{2,}}")
+
+# Any punctuation candidate, for returning text without punctuation unchanged. A match is
+# only a hint (supplementary characters always match); no match proves there is nothing to remove
+_PUNCT_SEARCH_RE = re.compile(f"[{_BMP_PUNCT_CHAR_CLASS}\\U00010000-\\U0010FFFF]")
+_ASCII_PUNCT_SEARCH_RE = re.compile(f"[{_ASCII_PUNCT_CHAR_CLASS}]")
+
+# Remover behind `UniText.remove_punctuations()`, the default of `UniText.make_punctuation_remover()`
+_remove_punctuations = _build_punctuation_remover(True, True, True, True, True)
+
+# Memoized removal results for short texts, which repeat heavily in subtitle corpora
+# (names, stock phrases). Longer texts bypass the caches to bound their memory use
+_MEMO_MAX_LENGTH = 256
+_MEMO_MAXSIZE = 4096
+_remove_punctuations_memo, _remove_punctuations_batch = _memoized(_remove_punctuations)
+_remove_consecutive_punctuations_memo, _remove_consecutive_punctuations_batch = _memoized(
+    _remove_consecutive_punctuations
+)
+_clean_punctuations_memo, _clean_punctuations_batch = _memoized(_clean_punctuations)
+
+# CJK code point ranges as inclusive (start, end) pairs (see `UniText.is_cjk_character()`)
+_CJK_RANGES = (
+    (0x4E00, 0x9FFF),  # CJK Unified Ideographs
+    (0x3400, 0x4DBF),  # CJK Extension A
+    (0x20000, 0x2A6DF),  # CJK Extension B
+    (0x2A700, 0x2B73F),  # CJK Extension C
+    (0x2B740, 0x2B81F),  # CJK Extension D
+    (0x2B820, 0x2CEAF),  # CJK Extension E
+    (0x2CEB0, 0x2EBEF),  # CJK Extension F
+    (0x30000, 0x3134F),  # CJK Extension G
+    (0x31350, 0x323AF),  # CJK Extension H
+    (0x2EBF0, 0x2EE5F),  # CJK Extension I
+    (0xF900, 0xFAFF),  # CJK Compatibility Ideographs
+    (0x2F800, 0x2FA1F),  # CJK Compatibility Ideographs Supplement
+    (0x3040, 0x309F),  # Hiragana
+    (0x30A0, 0x30FF),  # Katakana
+    (0xAC00, 0xD7AF),  # Hangul Syllables
+    (0x3100, 0x312F),  # Bopomofo (Zhuyin)
+)
+
+# CJK bitmaps for the BMP and for the supplementary ideographic planes, which start at _CJK_SIP_START
+_CJK_SIP_START = 0x20000
+_CJK_SIP_END = 0x323B0
+_CJK_BMP_BITMAP = _build_range_bitmap(_CJK_RANGES, 0, 0x10000)
+_CJK_SIP_BITMAP = _build_range_bitmap(_CJK_RANGES, _CJK_SIP_START, _CJK_SIP_END)
+
+
 class UniText:
     """
     Utility class for Unicode text processing.
@@ -20,47 +460,70 @@ class UniText:
     """
 
     # Chinese sentence-ending punctuation set
-    SENTENCE_END_PUNCTUATIONS_ZH = {
-        "。",  # Chinese period
-        "？",  # Chinese question mark
-        "！",  # Chinese exclamation mark
-        "；",  # Chinese semicolon
-        "…",  # Ellipsis (single character)
-        "……",  # Ellipsis (six dots)
-    }
+    SENTENCE_END_PUNCTUATIONS_ZH = frozenset(
+        {
+            "。",  # Chinese period
+            "？",  # Chinese question mark
+            "！",  # Chinese exclamation mark
+            "；",  # Chinese semicolon
+            "…",  # Ellipsis (single character)
+            "……",  # Ellipsis (six dots)
+        }
+    )
 
     # English sentence-ending punctuation set
-    SENTENCE_END_PUNCTUATIONS_EN = {
-        ".",  # English period
-        "?",  # English question mark
-        "!",  # English exclamation mark
-        ";",  # English semicolon
-        "…",  # Ellipsis (single character)
-        "...",  # Ellipsis (three dots)
-    }
+    SENTENCE_END_PUNCTUATIONS_EN = frozenset(
+        {
+            ".",  # English period
+            "?",  # English question mark
+            "!",  # English exclamation mark
+            ";",  # English semicolon
+            "…",  # Ellipsis (single character)
+            "...",  # Ellipsis (three dots)
+        }
+    )
 
     # Japanese sentence-ending punctuation set
-    SENTENCE_END_PUNCTUATIONS_JA = {
-        "。",  # Japanese period
-        "？",  # Japanese question mark
-        "！",  # Japanese exclamation mark
-        "；",  # Japanese semicolon
-        "……",  # Ellipsis (six dots)
-    }
+    SENTENCE_END_PUNCTUATIONS_JA = frozenset(
+        {
+            "。",  # Japanese period
+            "？",  # Japanese question mark
+            "！",  # Japanese exclamation mark
+            "；",  # Japanese semicolon
+            "……",  # Ellipsis (six dots)
+        }
+    )
 
     # Korean sentence-ending punctuation set
-    SENTENCE_END_PUNCTUATIONS_KO = {
-        ".",  # English period (also used in Korean)
-        "!",  # English exclamation mark
-        "?",  # English question mark
-        ";",  # English semicolon
-        "。",  # Full-width period
-        "！",  # Full-width exclamation mark
-        "？",  # Full-width question mark
-        "；",  # Full-width semicolon
-        "…",  # Ellipsis (single character)
-        "……",  # Ellipsis (six dots)
-        "...",  # Ellipsis (three dots)
+    SENTENCE_END_PUNCTUATIONS_KO = frozenset(
+        {
+            ".",  # English period (also used in Korean)
+            "!",  # English exclamation mark
+            "?",  # English question mark
+            ";",  # English semicolon
+            "。",  # Full-width period
+            "！",  # Full-width exclamation mark
+            "？",  # Full-width question mark
+            "；",  # Full-width semicolon
+            "…",  # Ellipsis (single character)
+            "……",  # Ellipsis (six dots)
+            "...",  # Ellipsis (three dots)
+        }
+    )
+
+    # Sentence-ending punctuation as tuples for a single str.endswith() call (longest first).
+    # The sets above are frozen, so these tuples can never go out of sync with them
+    _SENTENCE_END_TUPLE_ZH = tuple(sorted(SENTENCE_END_PUNCTUATIONS_ZH, key=len, reverse=True))
+    _SENTENCE_END_TUPLE_EN = tuple(sorted(SENTENCE_END_PUNCTUATIONS_EN, key=len, reverse=True))
+    _SENTENCE_END_TUPLE_JA = tuple(sorted(SENTENCE_END_PUNCTUATIONS_JA, key=len, reverse=True))
+    _SENTENCE_END_TUPLE_KO = tuple(sorted(SENTENCE_END_PUNCTUATIONS_KO, key=len, reverse=True))
+
+    # Sentence-ending punctuation tuples keyed by lowercase language type
+    _SENTENCE_END_TUPLES = {
+        "zh": _SENTENCE_END_TUPLE_ZH,
+        "en": _SENTENCE_END_TUPLE_EN,
+        "ja": _SENTENCE_END_TUPLE_JA,
+        "ko": _SENTENCE_END_TUPLE_KO,
     }
 
     @staticmethod
@@ -69,7 +532,8 @@ class UniText:
         Check if a character is a punctuation mark.
 
         Uses Unicode category to determine punctuation. All categories starting
-        with "P" are considered punctuation.
+        with "P" are considered punctuation. The punctuation characters are
+        collected once at import time, so the check is a single set lookup.
 
         Args:
             char: Character to check.
@@ -77,9 +541,8 @@ class UniText:
         Returns:
             bool: True if the character is punctuation, False otherwise.
         """
-        if not char or len(char) != 1:
-            return False
-        return unicodedata.category(char).startswith("P")
+        # Strings that are empty or longer than one character are never in the set
+        return char in _PUNCT_CHARS
 
     @staticmethod
     def remove_punctuations(text: str) -> str:
@@ -100,66 +563,68 @@ class UniText:
         Returns:
             str: Text with punctuation removed (special characters preserved).
         """
-        if not text:
-            return text
-
-        result = []
-        for i, char in enumerate(text):
-            if not UniText.is_punctuation(char):
-                result.append(char)
-            elif char == "'":
-                # Preserve apostrophes in English contractions and possessives
-                if i > 0 and i < len(text) - 1:
-                    # Contractions: "don't"
-                    if text[i - 1].isalpha() and text[i + 1].isalpha():
-                        result.append(char)
-                    # Possessives: "John's"
-                    elif text[i - 1].isalpha() and text[i + 1] in "sS":
-                        result.append(char)
-                elif i > 0:
-                    # Plural possessives: "workers'"
-                    if text[i - 1].isalpha() and (i == len(text) - 1 or text[i + 1] in " \n\t"):
-                        result.append(char)
-            elif char == ".":
-                # Preserve decimal points when used in numbers
-                is_decimal = False
-                if i > 0 and i < len(text) - 1:
-                    # Both sides are digits (e.g., "99.5")
-                    if text[i - 1].isdigit() and text[i + 1].isdigit():
-                        is_decimal = True
-                elif i > 0:
-                    # Preceded by digit, followed by space or end (e.g., "5.")
-                    if text[i - 1].isdigit():
-                        if i == len(text) - 1 or text[i + 1] in " \n\t":
-                            is_decimal = True
-                elif i < len(text) - 1:
-                    # Starts with decimal point, followed by digit (e.g., ".5")
-                    if text[i + 1].isdigit():
-                        is_decimal = True
-
-                if is_decimal:
-                    result.append(char)
-            elif char == "/":
-                # Preserve slashes in dates, fractions, or units (e.g., "2024/01/01", "1/2", "km/h")
-                if i > 0 and i < len(text) - 1:
-                    # Dates or fractions: digits on both sides (e.g., "2024/01/01", "1/2")
-                    if text[i - 1].isdigit() and text[i + 1].isdigit():
-                        result.append(char)
-                    # Units: letters on both sides (e.g., "km/h", "m/s")
-                    elif text[i - 1].isalpha() and text[i + 1].isalpha():
-                        result.append(char)
-            elif char in "%-":
-                # Always preserve percent signs and hyphens
-                result.append(char)
-
-        return "".join(result)
+        return _remove_punctuations_memo(text)
+
+    @staticmethod
+    def remove_punctuations_batch(texts: Iterable[str]) -> list[str]:
+        """
+        Remove punctuation marks from many texts in one call.
+
+        Batch variant of `remove_punctuations()` with identical results for
+        each text, sharing its memoization of short texts. The helpers are
+        bound once per batch instead of once per text, which saves the per-call
+        overhead when cleaning thousands of subtitle lines. All tables are
+        read-only, so batches may be processed from several threads concurrently.
+
+        Args:
+            texts: Original texts (may contain punctuation).
+
+        Returns:
+            list[str]: Texts with punctuation removed, in input order.
+        """
+        return _remove_punctuations_batch(texts)
+
+    @staticmethod
+    def make_punctuation_remover(
+        preserve_apostrophe: bool = True,
+        preserve_decimal: bool = True,
+        preserve_slash: bool = True,
+        preserve_percent: bool = True,
+        preserve_hyphen: bool = True,
+    ) -> Callable[[str], str]:
+        """
+        Create a punctuation remover specialised for the given preservation rules.
+
+        With all options enabled (the default) the returned function behaves
+        exactly like `remove_punctuations()`. Each disabled option removes that
+        mark unconditionally, e.g. ``preserve_apostrophe=False`` for Chinese
+        text that never contains contractions. The rules are compiled once per
+        combination of options and cached, so call this once and reuse the result.
+
+        Args:
+            preserve_apostrophe: Keep apostrophes in contractions and possessives.
+            preserve_decimal: Keep decimal points in numbers.
+            preserve_slash: Keep slashes in dates, fractions and units.
+            preserve_percent: Keep percent signs.
+            preserve_hyphen: Keep hyphens/dashes (-).
+
+        Returns:
+            Callable[[str], str]: Function taking the original text and returning it with punctuation removed.
+        """
+        return _build_punctuation_remover(
+            bool(preserve_apostrophe),
+            bool(preserve_decimal),
+            bool(preserve_slash),
+            bool(preserve_percent),
+            bool(preserve_hyphen),
+        )
 
     @staticmethod
     def remove_consecutive_punctuations(text: str) -> str:
         """
         Remove consecutive punctuation marks, keeping only the first one.
 
-        Uses `is_punctuation()` to detect punctuation. When consecutive punctuation
+        Uses the same punctuation definition as `is_punctuation()`. When consecutive punctuation
         marks are encountered (regardless of whether they are the same), only the
         first one is kept, and all subsequent consecutive punctuation marks are removed.
 
@@ -176,191 +641,193 @@ class UniText:
         Returns:
             str: Text with consecutive punctuation removed.
         """
-        if not text:
-            return text
-
-        result = []
-        prev_is_punc = False
-
-        for char in text:
-            is_punc = UniText.is_punctuation(char)
-
-            # If current character is punctuation and previous character is also punctuation, skip (regardless of whether they are the same)
-            if is_punc and prev_is_punc:
-                continue
-
-            # Otherwise add to result
-            result.append(char)
-            prev_is_punc = is_punc
-
-        return "".join(result)
+        return _remove_consecutive_punctuations_memo(text)
 
     @staticmethod
-    def is_cjk_character(code_point: int) -> bool:
+    def remove_consecutive_punctuations_batch(texts: Iterable[str]) -> list[str]:
         """
-        Check if a Unicode code point is a CJK character.
+        Remove consecutive punctuation marks from many texts in one call.
 
-        CJK character ranges include:
-        - CJK Unified Ideographs: 0x4E00-0x9FFF
-        - CJK Extension A: 0x3400-0x4DBF
-        - CJK Extension B: 0x20000-0x2A6DF
-        - CJK Extension C: 0x2A700-0x2B73F
-        - CJK Extension D: 0x2B740-0x2B81F
-        - CJK Extension E: 0x2B820-0x2CEAF
-        - CJK Extension F: 0x2CEB0-0x2EBEF
-        - CJK Extension G: 0x30000-0x3134F
-        - CJK Extension H: 0x31350-0x323AF
-        - CJK Extension I: 0x2EBF0-0x2EE5F
-        - CJK Compatibility Ideographs: 0xF900-0xFAFF
-        - CJK Compatibility Ideographs Supplement: 0x2F800-0x2FA1F
-        - Hiragana: 0x3040-0x309F
-        - Katakana: 0x30A0-0x30FF
-        - Hangul Syllables: 0xAC00-0xD7AF
-        - Bopomofo (Zhuyin): 0x3100-0x312F
+        Batch variant of `remove_consecutive_punctuations()` with identical
+        results for each text, sharing its memoization of short texts. All
+        tables are read-only, so batches may be processed from several
+        threads concurrently.
 
         Args:
-            code_point: Unicode code point (integer).
+            texts: Original texts (may contain repeated punctuation).
 
         Returns:
-            bool: True if the code point is a CJK character, False otherwise.
+            list[str]: Texts with consecutive punctuation removed, in input order.
         """
-        return (
-            (0x4E00 <= code_point <= 0x9FFF)  # CJK Unified Ideographs
-            or (0x3400 <= code_point <= 0x4DBF)  # CJK Extension A
-            or (0x20000 <= code_point <= 0x2A6DF)  # CJK Extension B
-            or (0x2A700 <= code_point <= 0x2B73F)  # CJK Extension C
-            or (0x2B740 <= code_point <= 0x2B81F)  # CJK Extension D
-            or (0x2B820 <= code_point <= 0x2CEAF)  # CJK Extension E
-            or (0x2CEB0 <= code_point <= 0x2EBEF)  # CJK Extension F
-            or (0x30000 <= code_point <= 0x3134F)  # CJK Extension G
-            or (0x31350 <= code_point <= 0x323AF)  # CJK Extension H
-            or (0x2EBF0 <= code_point <= 0x2EE5F)  # CJK Extension I
-            or (0xF900 <= code_point <= 0xFAFF)  # CJK Compatibility Ideographs
-            or (0x2F800 <= code_point <= 0x2FA1F)  # CJK Compatibility Ideographs Supplement
-            or (0x3040 <= code_point <= 0x309F)  # Hiragana
-            or (0x30A0 <= code_point <= 0x30FF)  # Katakana
-            or (0xAC00 <= code_point <= 0xD7AF)  # Hangul Syllables
-            or (0x3100 <= code_point <= 0x312F)  # Bopomofo (Zhuyin)
-        )
+        return _remove_consecutive_punctuations_batch(texts)
 
     @staticmethod
-    def _is_sentence_end_with_zh_punctuation(text: str) -> bool:
+    def clean_punctuations(
+        text: str,
+        collapse_consecutive: bool = True,
+        preserve_apostrophe: bool = True,
+        preserve_decimal: bool = True,
+        preserve_slash: bool = True,
+        preserve_percent: bool = True,
+        preserve_hyphen: bool = True,
+    ) -> str:
         """
-        Check if text ends with Chinese sentence-ending punctuation (private method).
+        Remove punctuation marks and collapse consecutive punctuation in one call.
+
+        A convenience wrapper with the same result as
+        ``remove_consecutive_punctuations(remove_punctuations(text))`` for the
+        default options. It still walks the text twice: the removal pass, then
+        a collapse pass over its result, which only looks for runs of percent
+        signs and hyphens since no other remaining mark can be next to another.
+
+        The preserve options work as in `make_punctuation_remover()`, and
+        ``collapse_consecutive=False`` skips the collapse pass. Only the default
+        options share the memoization of short texts.
 
-        Supported sentence-ending punctuation:
-        - Period: 。
-        - Question mark: ？
-        - Exclamation mark: ！
-        - Semicolon: ；
-        - Ellipsis: … (single character), …… (six dots)
+        Examples:
+            "Wait... 5%, -- ok!" -> "Wait 5% - ok"
+            "价格是 99.5 元，，很便宜。" -> "价格是 99.5 元很便宜"
 
         Args:
-            text: Text to check (can be a single character or multiple characters, e.g., "段。")
+            text: Original text (may contain punctuation).
+            collapse_consecutive: Keep only the first of consecutive remaining punctuation marks.
+            preserve_apostrophe: Keep apostrophes in contractions and possessives.
+            preserve_decimal: Keep decimal points in numbers.
+            preserve_slash: Keep slashes in dates, fractions and units.
+            preserve_percent: Keep percent signs.
+            preserve_hyphen: Keep hyphens/dashes (-).
 
         Returns:
-            bool: True if text ends with sentence-ending punctuation, False otherwise.
+            str: Text with punctuation removed and remaining consecutive punctuation collapsed.
         """
-        if not text:
-            return False
-
-        # Check if text ends with any sentence-ending punctuation
-        for punct in UniText.SENTENCE_END_PUNCTUATIONS_ZH:
-            if text.endswith(punct):
-                return True
-        return False
+        if (
+            collapse_consecutive
+            and preserve_apostrophe
+            and preserve_decimal
+            and preserve_slash
+            and preserve_percent
+            and preserve_hyphen
+        ):
+            return _clean_punctuations_memo(text)
+        text = _build_punctuation_remover(
+            bool(preserve_apostrophe),
+            bool(preserve_decimal),
+            bool(preserve_slash),
+            bool(preserve_percent),
+            bool(preserve_hyphen),
+        )(text)
+        if collapse_consecutive and text:
+            text = _KEPT_PUNCT_RUN_RE.sub(_collapse_punctuation_run, text)
+        return text
 
     @staticmethod
-    def _is_sentence_end_with_en_punctuation(text: str) -> bool:
+    def clean_punctuations_batch(texts: Iterable[str]) -> list[str]:
         """
-        Check if text ends with English sentence-ending punctuation (private method).
+        Remove punctuation marks and collapse consecutive punctuation in many texts.
 
-        Supported sentence-ending punctuation:
-        - Period: .
-        - Question mark: ?
-        - Exclamation mark: !
-        - Semicolon: ;
-        - Ellipsis: … (single character), ... (three dots)
+        Batch variant of `clean_punctuations()` with identical results for
+        each text, sharing its memoization of short texts. All tables are
+        read-only, so batches may be processed from several threads concurrently.
 
         Args:
-            text: Text to check (can be a single character or multiple characters, e.g., "end.")
+            texts: Original texts (may contain punctuation).
 
         Returns:
-            bool: True if text ends with sentence-ending punctuation, False otherwise.
+            list[str]: Cleaned texts, in input order.
         """
-        if not text:
-            return False
+        return _clean_punctuations_batch(texts)
 
-        # Check if text ends with any sentence-ending punctuation
-        for punct in UniText.SENTENCE_END_PUNCTUATIONS_EN:
-            if text.endswith(punct):
-                return True
-        return False
+    @staticmethod
+    def clear_cache() -> None:
+        """
+        Clear the memoized results of the punctuation removal methods.
+
+        `remove_punctuations()`, `remove_consecutive_punctuations()` and
+        `clean_punctuations()` (and their batch variants) remember results for
+        recently seen short texts. Call this to release that memory.
+        """
+        _remove_punctuations_memo.cache_clear()
+        _remove_consecutive_punctuations_memo.cache_clear()
+        _clean_punctuations_memo.cache_clear()
 
     @staticmethod
-    def _is_sentence_end_with_ja_punctuation(text: str) -> bool:
+    def is_cjk_character(code_point: int) -> bool:
         """
-        Check if text ends with Japanese sentence-ending punctuation (private method).
+        Check if a Unicode code point is a CJK character.
 
-        Supported sentence-ending punctuation:
-        - Period: 。
-        - Question mark: ？
-        - Exclamation mark: ！
-        - Semicolon: ；
-        - Ellipsis: …… (six dots)
+        CJK character ranges include:
+        - CJK Unified Ideographs: 0x4E00-0x9FFF
+        - CJK Extension A: 0x3400-0x4DBF
+        - CJK Extension B: 0x20000-0x2A6DF
+        - CJK Extension C: 0x2A700-0x2B73F
+        - CJK Extension D: 0x2B740-0x2B81F
+        - CJK Extension E: 0x2B820-0x2CEAF
+        - CJK Extension F: 0x2CEB0-0x2EBEF
+        - CJK Extension G: 0x30000-0x3134F
+        - CJK Extension H: 0x31350-0x323AF
+        - CJK Extension I: 0x2EBF0-0x2EE5F
+        - CJK Compatibility Ideographs: 0xF900-0xFAFF
+        - CJK Compatibility Ideographs Supplement: 0x2F800-0x2FA1F
+        - Hiragana: 0x3040-0x309F
+        - Katakana: 0x30A0-0x30FF
+        - Hangul Syllables: 0xAC00-0xD7AF
+        - Bopomofo (Zhuyin): 0x3100-0x312F
 
         Args:
-            text: Text to check (can be a single character or multiple characters, e.g., "終わり。")
+            code_point: Unicode code point (integer).
 
         Returns:
-            bool: True if text ends with sentence-ending punctuation, False otherwise.
+            bool: True if the code point is a CJK character, False otherwise.
         """
-        if not text:
-            return False
-
-        # Check if text ends with any sentence-ending punctuation
-        for punct in UniText.SENTENCE_END_PUNCTUATIONS_JA:
-            if text.endswith(punct):
-                return True
+        # CJK Unified Ideographs dominate Chinese text, so they skip the table lookup
+        if 0x4E00 <= code_point <= 0x9FFF:
+            return True
+        if 0 <= code_point < 0x10000:
+            return (_CJK_BMP_BITMAP[code_point >> 3] >> (code_point & 7)) & 1 == 1
+        if _CJK_SIP_START <= code_point < _CJK_SIP_END:
+            offset = code_point - _CJK_SIP_START
+            return (_CJK_SIP_BITMAP[offset >> 3] >> (offset & 7)) & 1 == 1
         return False
 
     @staticmethod
-    def _is_sentence_end_with_ko_punctuation(text: str) -> bool:
+    def is_cjk_characters(code_points: str | Iterable[int]) -> list[bool]:
         """
-        Check if text ends with Korean sentence-ending punctuation (private method).
-
-        Supported sentence-ending punctuation:
-        - Half-width period: .
-        - Half-width question mark: ?
-        - Half-width exclamation mark: !
-        - Half-width semicolon: ;
-        - Full-width period: 。
-        - Full-width question mark: ？
-        - Full-width exclamation mark: ！
-        - Full-width semicolon: ；
-        - Ellipsis: … (single character), …… (six dots), ... (three dots)
+        Check a sequence of Unicode code points for CJK characters in one call.
+
+        Batch variant of `is_cjk_character()` using the same ranges. The
+        lookup tables are bound once per call instead of once per code point,
+        which matters when scanning long transcripts.
 
         Args:
-            text: Text to check (can be a single character or multiple characters, e.g., "끝.")
+            code_points: Unicode code points (integers), or a string whose
+                characters are checked.
 
         Returns:
-            bool: True if text ends with sentence-ending punctuation, False otherwise.
+            list[bool]: One flag per code point, True where it is a CJK character.
         """
-        if not text:
-            return False
-
-        # Check if text ends with any sentence-ending punctuation
-        for punct in UniText.SENTENCE_END_PUNCTUATIONS_KO:
-            if text.endswith(punct):
-                return True
-        return False
+        if isinstance(code_points, str):
+            code_points = map(ord, code_points)
+
+        bmp = _CJK_BMP_BITMAP
+        sip = _CJK_SIP_BITMAP
+        sip_start = _CJK_SIP_START
+        sip_end = _CJK_SIP_END
+        return [
+            0x4E00 <= cp <= 0x9FFF
+            or (
+                (bmp[cp >> 3] >> (cp & 7)) & 1 == 1
+                if 0 <= cp < 0x10000
+                else sip_start <= cp < sip_end and (sip[(cp - sip_start) >> 3] >> (cp & 7)) & 1 == 1
+            )
+            for cp in code_points
+        ]
 
     @staticmethod
     def is_sentence_end_with_punctuation(text: str, lang: str) -> bool:
         """
         Check if text ends with sentence-ending punctuation (based on language type).
 
-        Calls the corresponding private method based on the specified language type.
+        Looks up the sentence-ending punctuation of the specified language type.
         Supported language types: 'zh' (Chinese), 'en' (English), 'ja' (Japanese), 'ko' (Korean).
 
         Can be used to check if a Word's word field (e.g., "段。", "end.") ends with
@@ -379,14 +846,11 @@ class UniText:
         if not text:
             return False
 
-        lang = lang.lower()
-        if lang == "zh":
-            return UniText._is_sentence_end_with_zh_punctuation(text)
-        elif lang == "en":
-            return UniText._is_sentence_end_with_en_punctuation(text)
-        elif lang == "ja":
-            return UniText._is_sentence_end_with_ja_punctuation(text)
-        elif lang == "ko":
-            return UniText._is_sentence_end_with_ko_punctuation(text)
-        else:
-            raise ValueError(f"Unsupported language: {lang}. Supported languages: 'zh', 'en', 'ja', 'ko'")
+        # Canonical lowercase language types hit directly; only other spellings are lowercased
+        suffixes = UniText._SENTENCE_END_TUPLES.get(lang)
+        if suffixes is None:
+            lang = lang.lower()
+            suffixes = UniText._SENTENCE_END_TUPLES.get(lang)
+            if suffixes is None:
+                raise ValueError(f"Unsupported language: {lang}. Supported languages: 'zh', 'en', 'ja', 'ko'")
+        return text.endswith(suffixes)
@@ -0,0 +1,40 @@
+"""
+Tests for the precomputed tables in uni_text._tables
+
+A stale table for the running Unicode version would be used without any
+error, so each shipped table is compared against a fresh build.
+"""
+
+import unicodedata
+import zlib
+
+import pytest
+
+from uni_text import _tables
+from uni_text import uni_text as impl
+
+_PREDICATES = {
+    "punct": impl._is_punctuation_category,
+    "alpha": str.isalpha,
+    "digit": str.isdigit,
+}
+
+
+def test_tables_shipped_for_running_unicode_version():
+    # Newer interpreters fall back to building the tables at import, which is slower but correct
+    if unicodedata.unidata_version not in _tables.BITMAPS:
+        pytest.skip(f"No precomputed tables for Unicode {unicodedata.unidata_version}; run scripts/gen_tables.py")
+
+
+@pytest.mark.parametrize("name", sorted(_PREDICATES))
+def test_shipped_table_matches_build(name):
+    shipped = _tables.BITMAPS.get(unicodedata.unidata_version)
+    if shipped is None:
+        pytest.skip(f"No precomputed tables for Unicode {unicodedata.unidata_version}")
+    assert zlib.decompress(bytes.fromhex(shipped[name])) == impl._build_char_bitmap(_PREDICATES[name])
+
+
+def test_loaded_bitmaps_match_build():
+    assert impl._PUNCT_BITMAP == impl._build_char_bitmap(_PREDICATES["punct"])
+    assert impl._ALPHA_BITMAP == impl._build_char_bitmap(_PREDICATES["alpha"])
+    assert impl._DIGIT_BITMAP == impl._build_char_bitmap(_PREDICATES["digit"])
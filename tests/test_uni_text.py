@@ -0,0 +1,316 @@
+"""
+Tests for uni_text.UniText
+
+Documented examples plus differential checks against the original
+character-by-character implementations, which are kept below as references.
+"""
+
+import itertools
+import random
+import unicodedata
+
+import pytest
+
+from uni_text import UniText
+
+
+def _reference_is_punctuation(char: str) -> bool:
+    """Original `UniText.is_punctuation()`."""
+    if not char or len(char) != 1:
+        return False
+    return unicodedata.category(char).startswith("P")
+
+
+def _reference_remove_punctuations(text: str) -> str:
+    """Original `UniText.remove_punctuations()` loop."""
+    if not text:
+        return text
+
+    result = []
+    for i, char in enumerate(text):
+        if not _reference_is_punctuation(char):
+            result.append(char)
+        elif char == "'":
+            if i > 0 and i < len(text) - 1:
+                if text[i - 1].isalpha() and text[i + 1].isalpha():
+                    result.append(char)
+                elif text[i - 1].isalpha() and text[i + 1] in "sS":
+                    result.append(char)
+            elif i > 0:
+                if text[i - 1].isalpha() and (i == len(text) - 1 or text[i + 1] in " \n\t"):
+                    result.append(char)
+        elif char == ".":
+            is_decimal = False
+            if i > 0 and i < len(text) - 1:
+                if text[i - 1].isdigit() and text[i + 1].isdigit():
+                    is_decimal = True
+            elif i > 0:
+                if text[i - 1].isdigit():
+                    if i == len(text) - 1 or text[i + 1] in " \n\t":
+                        is_decimal = True
+            elif i < len(text) - 1:
+                if text[i + 1].isdigit():
+                    is_decimal = True
+
+            if is_decimal:
+                result.append(char)
+        elif char == "/":
+            if i > 0 and i < len(text) - 1:
+                if text[i - 1].isdigit() and text[i + 1].isdigit():
+                    result.append(char)
+                elif text[i - 1].isalpha() and text[i + 1].isalpha():
+                    result.append(char)
+        elif char in "%-":
+            result.append(char)
+
+    return "".join(result)
+
+
+def _reference_remove_consecutive_punctuations(text: str) -> str:
+    """Original `UniText.remove_consecutive_punctuations()` loop."""
+    if not text:
+        return text
+
+    result = []
+    prev_is_punc = False
+    for char in text:
+        is_punc = _reference_is_punctuation(char)
+        if is_punc and prev_is_punc:
+            continue
+        result.append(char)
+        prev_is_punc = is_punc
+    return "".join(result)
+
+
+# Characters around the context-sensitive marks: ASCII and non-ASCII letters and digits,
+# "s"/"S" after apostrophes, whitespace, other punctuation and supplementary characters
+_EDGE_ALPHABET = [
+    "a",
+    "s",
+    "S",
+    "é",
+    "中",
+    "𐐀",  # Deseret capital letter, supplementary letter
+    "1",
+    "٣",  # Arabic-Indic digit three
+    "²",  # Superscript two, isdigit() but not isalpha()
+    "𝟙",  # Mathematical double-struck digit one, supplementary digit
+    " ",
+    "\n",
+    "'",
+    ".",
+    "/",
+    ",",
+    "%",
+    "-",
+    "，",
+    "𝄆",  # Supplementary symbol that is not punctuation
+]
+
+
+def _edge_texts():
+    """Every text of up to three edge characters, plus longer seeded random texts."""
+    for length in range(1, 4):
+        for chars in itertools.product(_EDGE_ALPHABET, repeat=length):
+            yield "".join(chars)
+    rng = random.Random(0)
+    for _ in range(3000):
+        yield "".join(rng.choices(_EDGE_ALPHABET, k=rng.randint(4, 12)))
+
+
+def test_is_punctuation_examples():
+    assert UniText.is_punctuation(",")
+    assert UniText.is_punctuation("。")
+    assert not UniText.is_punctuation("a")
+    assert not UniText.is_punctuation("")
+    assert not UniText.is_punctuation("..")
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("Hello, world! Don't worry. John's book is here.", "Hello world Don't worry John's book is here"),
+        ("Hello, world! Don't worry - it's 100% safe.", "Hello world Don't worry - it's 100% safe"),
+        ("价格是 99.5 元，很便宜。", "价格是 99.5 元很便宜"),
+        ("This is a sentence. Another one.", "This is a sentence Another one"),
+        ("The value is 5.", "The value is 5."),
+        ("Date: 2024/01/01, fraction: 1/2", "Date 2024/01/01 fraction 1/2"),
+        ("John's book is here.", "John's book is here"),
+        ("These books are the workers'", "These books are the workers'"),
+        (".5 is half", ".5 is half"),
+        ("Speed: 100 km/h, ratio: 1/2", "Speed 100 km/h ratio 1/2"),
+        ("", ""),
+    ],
+)
+def test_remove_punctuations_examples(text, expected):
+    assert UniText.remove_punctuations(text) == expected
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("你好，，，世界", "你好，世界"),
+        ("这是。。。测试", "这是。测试"),
+        ("多个！！！感叹号", "多个！感叹号"),
+        ("混合，。，。标点", "混合，标点"),
+        ("测试！？。结束", "测试！结束"),
+        ("", ""),
+    ],
+)
+def test_remove_consecutive_punctuations_examples(text, expected):
+    assert UniText.remove_consecutive_punctuations(text) == expected
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("Wait... 5%, -- ok!", "Wait 5% - ok"),
+        ("价格是 99.5 元，，很便宜。", "价格是 99.5 元很便宜"),
+        ("", ""),
+    ],
+)
+def test_clean_punctuations_examples(text, expected):
+    assert UniText.clean_punctuations(text) == expected
+
+
+def test_remove_punctuations_matches_reference():
+    for text in _edge_texts():
+        assert UniText.remove_punctuations(text) == _reference_remove_punctuations(text), repr(text)
+
+
+def test_remove_consecutive_punctuations_matches_reference():
+    for text in _edge_texts():
+        expected = _reference_remove_consecutive_punctuations(text)
+        assert UniText.remove_consecutive_punctuations(text) == expected, repr(text)
+
+
+def test_clean_punctuations_matches_reference():
+    for text in _edge_texts():
+        expected = _reference_remove_consecutive_punctuations(_reference_remove_punctuations(text))
+        assert UniText.clean_punctuations(text) == expected, repr(text)
+
+
+def test_long_texts_bypass_memoization():
+    text = "Don't stop, 2024/01/01! " * 20
+    assert len(text) > 256
+    assert UniText.remove_punctuations(text) == _reference_remove_punctuations(text)
+    assert UniText.clean_punctuations(text) == UniText.remove_consecutive_punctuations(
+        UniText.remove_punctuations(text)
+    )
+    UniText.clear_cache()
+    assert UniText.remove_punctuations("a, b") == "a b"
+
+
+def test_none_is_returned_unchanged():
+    assert UniText.remove_punctuations(None) is None
+    assert UniText.remove_consecutive_punctuations(None) is None
+    assert UniText.clean_punctuations(None) is None
+
+
+def test_remove_punctuations_batch_matches_single_calls():
+    texts = list(itertools.islice(_edge_texts(), 20000, 20500)) + ["", "Hello, world!", "你好，，世界。"]
+    assert UniText.remove_punctuations_batch(texts) == [UniText.remove_punctuations(t) for t in texts]
+    assert UniText.remove_punctuations_batch(iter(texts)) == [UniText.remove_punctuations(t) for t in texts]
+
+
+def test_collapse_and_clean_batch_match_single_calls():
+    texts = list(itertools.islice(_edge_texts(), 20000, 20500)) + ["", "Hello, world!", "你好，，世界。"]
+    assert UniText.remove_consecutive_punctuations_batch(texts) == [
+        UniText.remove_consecutive_punctuations(t) for t in texts
+    ]
+    assert UniText.clean_punctuations_batch(iter(texts)) == [UniText.clean_punctuations(t) for t in texts]
+
+
+def test_make_punctuation_remover():
+    remove = UniText.make_punctuation_remover(preserve_apostrophe=False, preserve_slash=False)
+    assert remove("Don't go, it's 1/2 price!") == "Dont go its 12 price"
+    assert UniText.make_punctuation_remover(preserve_decimal=False)("99.5%") == "995%"
+    assert UniText.make_punctuation_remover(preserve_percent=False, preserve_hyphen=False)("5% - x") == "5  x"
+
+    default = UniText.make_punctuation_remover()
+    for text in itertools.islice(_edge_texts(), 0, None, 7):
+        assert default(text) == UniText.remove_punctuations(text), repr(text)
+
+
+@pytest.mark.parametrize("collapse_consecutive", [True, False])
+@pytest.mark.parametrize(
+    "options",
+    [
+        {},
+        {"preserve_apostrophe": False},
+        {"preserve_decimal": False, "preserve_slash": False},
+        {"preserve_percent": False},
+        {"preserve_hyphen": False},
+        {"preserve_percent": False, "preserve_hyphen": False},
+    ],
+)
+def test_clean_punctuations_options(collapse_consecutive, options):
+    remove = UniText.make_punctuation_remover(**options)
+    for text in itertools.islice(_edge_texts(), 0, None, 7):
+        expected = remove(text)
+        if collapse_consecutive:
+            expected = _reference_remove_consecutive_punctuations(expected)
+        assert UniText.clean_punctuations(text, collapse_consecutive, **options) == expected, repr(text)
+
+
+def _reference_is_cjk_character(code_point: int) -> bool:
+    """Original `UniText.is_cjk_character()` range chain."""
+    return (
+        (0x4E00 <= code_point <= 0x9FFF)
+        or (0x3400 <= code_point <= 0x4DBF)
+        or (0x20000 <= code_point <= 0x2A6DF)
+        or (0x2A700 <= code_point <= 0x2B73F)
+        or (0x2B740 <= code_point <= 0x2B81F)
+        or (0x2B820 <= code_point <= 0x2CEAF)
+        or (0x2CEB0 <= code_point <= 0x2EBEF)
+        or (0x30000 <= code_point <= 0x3134F)
+        or (0x31350 <= code_point <= 0x323AF)
+        or (0x2EBF0 <= code_point <= 0x2EE5F)
+        or (0xF900 <= code_point <= 0xFAFF)
+        or (0x2F800 <= code_point <= 0x2FA1F)
+        or (0x3040 <= code_point <= 0x309F)
+        or (0x30A0 <= code_point <= 0x30FF)
+        or (0xAC00 <= code_point <= 0xD7AF)
+        or (0x3100 <= code_point <= 0x312F)
+    )
+
+
+def test_is_cjk_character_matches_reference():
+    code_points = [*range(-2, 0x40000), 0x10FFFF, 0x110000]
+    assert [UniText.is_cjk_character(cp) for cp in code_points] == [
+        _reference_is_cjk_character(cp) for cp in code_points
+    ]
+
+
+def test_is_cjk_characters_examples():
+    assert UniText.is_cjk_characters("A中あ") == [False, True, True]
+    assert UniText.is_cjk_characters([ord("한"), ord("!")]) == [True, False]
+    assert UniText.is_cjk_characters("") == []
+
+
+def test_is_cjk_characters_matches_reference():
+    code_points = [*range(-2, 0x40000), 0x10FFFF, 0x110000]
+    assert UniText.is_cjk_characters(code_points) == [_reference_is_cjk_character(cp) for cp in code_points]
+
+
+@pytest.mark.parametrize(
+    ("text", "lang", "expected"),
+    [
+        ("这是一段文字。", "zh", True),
+        ("这是问题？", "zh", True),
+        ("这是感叹！", "zh", True),
+        ("这是逗号，继续", "zh", False),
+        ("This is a sentence.", "en", True),
+        ("Is this a question?", "EN", True),
+        ("これは文章です。", "ja", True),
+        ("이것은 문장입니다.", "ko", True),
+        ("", "en", False),
+    ],
+)
+def test_is_sentence_end_with_punctuation(text, lang, expected):
+    assert UniText.is_sentence_end_with_punctuation(text, lang) is expected
+
+
+def test_is_sentence_end_with_punctuation_rejects_unknown_language():
+    with pytest.raises(ValueError, match="Unsupported language: fr"):
+        UniText.is_sentence_end_with_punctuation("Bonjour.", "fr")